@@ -1,13 +1,217 @@
-import re
+import random
 import pygame
 from Parameters import square_size, outer_margin
 
+# The distinct piece types. Used to key the per-color bitboards on the board
+PIECE_NAMES = ('Pawn', 'Knight', 'Bishop', 'Rook', 'Queen', 'King')
+
+# Integer ids for the piece types, for cheap type comparisons on the hot path
+PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING = range(1, 7)
+
+# Map each color to the opposing color
+OPPONENT_COLOR = {'white': 'black', 'black': 'white'}
+
+# Map each coordinate string straight to its (row, col) board indices.
+# Rows are reversed because row 0 of the board list is rank 8.
+DECODED_COORDINATES = {letter + number: (8 - int(number), 'abcdefgh'.index(letter))
+                       for letter in 'abcdefgh' for number in '12345678'}
+
+
+def _build_zobrist_table() -> dict:
+    """
+    Build the table of 64-bit keys used to incrementally hash board positions.
+    Each (color, piece name, square) combination gets its own key; a position's hash
+    is the XOR of the keys of the pieces on the board. Seeded so hashes are
+    reproducible across runs.
+    """
+
+    generator = random.Random(20230114)
+    return {(color, name): tuple(generator.getrandbits(64) for _ in range(64))
+            for color in ('white', 'black') for name in PIECE_NAMES}
+
+
+ZOBRIST_KEYS = _build_zobrist_table()
+
+
+def _build_step_attack_table(offsets) -> tuple:
+    """
+    Build a 64-entry tuple of attack bitboards for a piece that moves by a fixed set of offsets.
+    Entry n holds the bitboard of squares reachable from square n (row * 8 + col).
+    """
+
+    table = []
+
+    for square in range(64):
+        row, col = square // 8, square % 8
+        bitboard = 0
+
+        for row_offset, col_offset in offsets:
+            target_row, target_col = row + row_offset, col + col_offset
+            if 0 <= target_row <= 7 and 0 <= target_col <= 7:
+                bitboard |= 1 << (target_row * 8 + target_col)
+
+        table.append(bitboard)
+
+    return tuple(table)
+
+
+# Precomputed attack tables for the two fixed-offset pieces, built once at import
+KNIGHT_ATTACKS = _build_step_attack_table(((1, 2), (1, -2), (-1, 2), (-1, -2), (2, 1), (2, -1), (-2, 1), (-2, -1)))
+KING_ATTACKS = _build_step_attack_table(((1, 1), (1, -1), (-1, 1), (-1, -1), (1, 0), (0, 1), (-1, 0), (0, -1)))
+
+# Squares a pawn of each color attacks (the two forward diagonals)
+PAWN_ATTACKS = {
+    'white': _build_step_attack_table(((-1, 1), (-1, -1))),
+    'black': _build_step_attack_table(((1, 1), (1, -1))),
+}
+
+# The eight ray directions as (vertical, horizontal) steps.
+# A direction is 'positive' if it points towards higher square numbers, which decides
+# whether the first blocker on a ray is the lowest or the highest set bit.
+RAY_DIRECTIONS = ((1, 1), (1, -1), (-1, 1), (-1, -1), (1, 0), (0, 1), (-1, 0), (0, -1))
+RAY_IS_POSITIVE = (True, True, False, False, True, True, False, False)
+
+
+def _build_ray_table(direction) -> tuple:
+    """Build a 64-entry tuple of ray bitboards for the passed (vertical, horizontal) direction"""
+
+    vertical_direction, horizontal_direction = direction
+    table = []
+
+    for square in range(64):
+        row, col = square // 8, square % 8
+        bitboard = 0
+
+        target_row, target_col = row + vertical_direction, col + horizontal_direction
+        while 0 <= target_row <= 7 and 0 <= target_col <= 7:
+            bitboard |= 1 << (target_row * 8 + target_col)
+            target_row += vertical_direction
+            target_col += horizontal_direction
+
+        table.append(bitboard)
+
+    return tuple(table)
+
+
+# Per-direction ray bitboards for the sliding pieces, built once at import
+RAY_ATTACKS = tuple(_build_ray_table(direction) for direction in RAY_DIRECTIONS)
+
+
+def get_ray_attacks(square: int, direction_index: int, occupancy: int) -> int:
+    """
+    Return the attack bitboard for a ray cast from the passed square,
+    cut off at the first blocker in the passed occupancy (blocker included)
+    """
+
+    ray_table = RAY_ATTACKS[direction_index]
+    attacks = ray_table[square]
+    blockers = attacks & occupancy
+
+    if blockers:
+        if RAY_IS_POSITIVE[direction_index]:  # The first blocker is the lowest set bit
+            first_blocker_square = (blockers & -blockers).bit_length() - 1
+        else:  # The first blocker is the highest set bit
+            first_blocker_square = blockers.bit_length() - 1
+
+        # Everything on the ray past the blocker is unreachable
+        attacks ^= ray_table[first_blocker_square]
+
+    return attacks
+
+
+# The four lines a sliding piece can move along, as pairs of opposite ray direction indices
+LINE_RAY_PAIRS = ((5, 7), (4, 6), (0, 3), (1, 2))  # Rank, file, diagonal, antidiagonal
+
+
+def _build_line_attack_tables() -> tuple:
+    """
+    Build the per-line attack lookup tables.
+
+    For every square and line, every possible occupancy of that line is enumerated
+    (with the carry-rippler trick) and mapped to its attack bitboard, so a sliding
+    piece's reach along a line becomes a single mask-and-lookup at runtime.
+
+    Returns (masks, tables) where masks[line][square] is the line's occupancy mask
+    and tables[line][square][masked_occupancy] is the attack bitboard.
+    """
+
+    masks = []
+    tables = []
+
+    for first_direction, second_direction in LINE_RAY_PAIRS:
+        line_masks = []
+        line_tables = []
+
+        for square in range(64):
+            mask = RAY_ATTACKS[first_direction][square] | RAY_ATTACKS[second_direction][square]
+            attacks_by_occupancy = {}
+
+            # Enumerate every subset of the mask: subset = (subset - mask) & mask
+            subset = 0
+            while True:
+                attacks_by_occupancy[subset] = (get_ray_attacks(square, first_direction, subset)
+                                                | get_ray_attacks(square, second_direction, subset))
+                subset = (subset - mask) & mask
+                if subset == 0:
+                    break
+
+            line_masks.append(mask)
+            line_tables.append(attacks_by_occupancy)
+
+        masks.append(tuple(line_masks))
+        tables.append(tuple(line_tables))
+
+    return tuple(masks), tuple(tables)
+
+
+LINE_MASKS, LINE_ATTACK_TABLES = _build_line_attack_tables()
+
+
+def _build_between_table() -> tuple:
+    """
+    Build the between-squares lookup table.
+
+    BETWEEN[from_square][to_square] is a bitboard of the squares strictly between
+    the two squares when they share a rank, file or diagonal, and 0 otherwise.
+    """
+
+    table = []
+    for square in range(64):
+        row, col = square // 8, square % 8
+        entries = [0] * 64
+
+        for direction_row, direction_col in RAY_DIRECTIONS:
+            between = 0
+            step = 1
+            while True:
+                next_row, next_col = row + direction_row * step, col + direction_col * step
+                if not (0 <= next_row <= 7 and 0 <= next_col <= 7):
+                    break
+                entries[next_row * 8 + next_col] = between
+                between |= 1 << (next_row * 8 + next_col)
+                step += 1
+
+        table.append(tuple(entries))
+
+    return tuple(table)
+
+
+BETWEEN = _build_between_table()
+
+
+def get_line_attacks(square: int, line_index: int, occupancy: int) -> int:
+    """Return the attack bitboard for both rays of the passed line, read from the precomputed tables"""
+
+    return LINE_ATTACK_TABLES[line_index][square][occupancy & LINE_MASKS[line_index][square]]
+
 
 class ChessMove:
     """
     Represents a chess move.
     """
 
+    __slots__ = ('color', 'type', 'move_piece', 'remove_piece', 'move_from', 'move_to', 'remove_from')
+
     def __init__(self, color, type, move_piece, remove_piece, move_from, move_to, remove_from):
         """
         :param color: The color of the player moving
@@ -62,34 +266,51 @@ class ChessMove:
 
         return self.remove_from
 
-    def get_move(self) -> tuple:
-        """Return the move data as a tuple"""
-
-        return self.color, self.type, self.move_piece, self.remove_piece, self.move_from, self.move_to, self.remove_from
-
 
 class ChessBoard:
     """
     Represents a chess board
 
-    Change the self._chess_board data member to the test_board for testing purposes
+    Change the self._chess_board data member to _build_test_board() for testing purposes
     """
 
     def __init__(self, game):
 
-        # Define the boards
+        # Build the starting position. The back rank mirrors for both colors, and the
+        # test board is only constructed (with its 16 piece objects) if it is swapped in
+        back_rank = (Rook, Knight, Bishop, Queen, King, Bishop, Knight, Rook)
         main_board = [
-            [Rook('black'), Knight('black'), Bishop('black'), Queen('black'), King('black'), Bishop('black'), Knight('black'), Rook('black')],
-            [Pawn('black'), Pawn('black'), Pawn('black'), Pawn('black'), Pawn('black'), Pawn('black'), Pawn('black'), Pawn('black')],
-            [None, None, None, None, None, None, None, None],
-            [None, None, None, None, None, None, None, None],
-            [None, None, None, None, None, None, None, None],
-            [None, None, None, None, None, None, None, None],
-            [Pawn('white'), Pawn('white'), Pawn('white'), Pawn('white'), Pawn('white'), Pawn('white'), Pawn('white'), Pawn('white')],
-            [Rook('white'), Knight('white'), Bishop('white'), Queen('white'), King('white'), Bishop('white'), Knight('white'),Rook('white')]
+            [piece_class('black') for piece_class in back_rank],
+            [Pawn('black') for _ in range(8)],
+            [None] * 8,
+            [None] * 8,
+            [None] * 8,
+            [None] * 8,
+            [Pawn('white') for _ in range(8)],
+            [piece_class('white') for piece_class in back_rank],
         ]
 
-        test_board = [
+        self._game = game
+        self._chess_board = main_board
+        self._column_map = {'a': 0, 'b': 1, 'c': 2, 'd': 3, 'e': 4, 'f': 5, 'g': 6, 'h': 7}  # Map col letters to list indices
+
+        # Bitboard representation of the board. Square (row, col) maps to bit 1 << (row * 8 + col).
+        # One bitboard per (color, piece name) plus an occupancy mask per color.
+        # The _chess_board list doubles as the square-to-piece lookup.
+        self._piece_bitboards = {(color, name): 0 for color in ('white', 'black') for name in PIECE_NAMES}
+        self._occupancy = {'white': 0, 'black': 0}
+        self._zobrist_hash = 0  # Incrementally updated 64-bit hash of the piece placement
+
+        for i, row in enumerate(self._chess_board):
+            for j, cell in enumerate(row):
+                if cell is not None:
+                    self._set_square_bit(cell, (i, j))
+
+    @staticmethod
+    def _build_test_board() -> list:
+        """Return a sparse board layout for trying out scenarios by hand"""
+
+        return [
             [Rook('black'), Knight('black'), Bishop('black'), None, King('black'), None, None, None],
             [None, Pawn('black'), None, None, None, None, None, None],
             [None, None, None, None, None, None, None, None],
@@ -100,9 +321,35 @@ class ChessBoard:
             [King('white'), Knight('white'), None, None, None, None, None, None]
         ]
 
-        self._game = game
-        self._chess_board = main_board
-        self._column_map = {'a': 0, 'b': 1, 'c': 2, 'd': 3, 'e': 4, 'f': 5, 'g': 6, 'h': 7}  # Map col letters to list indices
+    def _set_square_bit(self, piece, position) -> None:
+        """
+        Set the bit at the passed position in the piece's bitboard and its color's
+        occupancy mask, and XOR the piece into the position hash
+        """
+
+        square = position[0] * 8 + position[1]
+        bit = 1 << square
+        color = piece.get_color()
+        piece_key = (color, piece.get_class_name())
+
+        self._piece_bitboards[piece_key] |= bit
+        self._occupancy[color] |= bit
+        self._zobrist_hash ^= ZOBRIST_KEYS[piece_key][square]
+
+    def _clear_square_bit(self, piece, position) -> None:
+        """
+        Clear the bit at the passed position in the piece's bitboard and its color's
+        occupancy mask, and XOR the piece out of the position hash
+        """
+
+        square = position[0] * 8 + position[1]
+        bit = 1 << square
+        color = piece.get_color()
+        piece_key = (color, piece.get_class_name())
+
+        self._piece_bitboards[piece_key] &= ~bit
+        self._occupancy[color] &= ~bit
+        self._zobrist_hash ^= ZOBRIST_KEYS[piece_key][square]
 
     def get_board(self):
         """Return the chess board"""
@@ -120,18 +367,39 @@ class ChessBoard:
 
         return self._column_map
 
+    def get_occupancy(self, color: str) -> int:
+        """Return the occupancy bitboard for the passed color"""
+
+        return self._occupancy[color]
+
+    def get_piece_bitboard(self, color: str, piece_name: str) -> int:
+        """Return the bitboard for the passed color and piece name"""
+
+        return self._piece_bitboards[(color, piece_name)]
+
+    def get_zobrist_hash(self) -> int:
+        """Return the incrementally maintained hash of the current piece placement"""
+
+        return self._zobrist_hash
+
     def get_piece_positions(self, color: str, piece_name=None) -> list:
         """
         Return the positions of the pieces for the passed color
         Can also specify a piece name to only return pieces which match the name
         """
 
-        positions = []
+        if piece_name is None:
+            bitboard = self._occupancy[color]
+        else:
+            bitboard = self._piece_bitboards[(color, piece_name)]
 
-        for i, row in enumerate(self._chess_board):
-            for j, cell in enumerate(row):
-                if cell is not None and cell.get_color() == color and (piece_name is None or cell.get_class_name() == piece_name):
-                    positions.append((i, j))
+        # Pop the least significant bit until the bitboard is empty
+        positions = []
+        while bitboard:
+            least_significant_bit = bitboard & -bitboard
+            square = least_significant_bit.bit_length() - 1
+            positions.append((square // 8, square % 8))
+            bitboard ^= least_significant_bit
 
         return positions
 
@@ -150,27 +418,26 @@ class ChessBoard:
         Prints the board with row and column headers to the console
         """
 
-        # Print columns first
-        print('  ', end='')  # Need a spot for the row header
-        for letter in self._column_map:
-            print(letter, end=' ')
-        print()  # New line
+        # Build the whole board as one string so it reaches the console in a single write
+        lines = ['  ' + ' '.join(self._column_map) + ' ']  # Column headers with a spot for the row header
 
-        # Print the row header then the rows
         for i, row in enumerate(self._chess_board):
-            print(8 - i, end=' ')  # Row header
-            for cell in row:
-                if cell is None:
-                    print(' ', end=' ')
-                else:
-                    print(cell.get_visual(), end=' ')
-            print()
+            cells = ' '.join(' ' if cell is None else cell.get_visual() for cell in row)
+            lines.append(f'{8 - i} {cells} ')  # Row header then the row
+
+        print('\n'.join(lines))
 
     def add_piece_at_position(self, piece, position) -> None:
         """Add a piece at the passed position"""
 
         row, col = position
 
+        # Keep the bitboards in sync with the piece being replaced (if any) and the piece being added
+        replaced_piece = self._chess_board[row][col]
+        if replaced_piece is not None:
+            self._clear_square_bit(replaced_piece, position)
+        self._set_square_bit(piece, position)
+
         self._chess_board[row][col] = piece
         piece.update_position((row, col))
 
@@ -179,12 +446,28 @@ class ChessBoard:
         Update the position of a piece on the board based on the passed move object.
         """
         
-        color, move_type, moving_piece, remove_piece, from_position, to_position, remove_position = move_object.get_move()
+        # Read the move fields directly; these are C-level slot loads
+        color = move_object.color
+        move_type = move_object.type
+        moving_piece = move_object.move_piece
+        from_position = move_object.move_from
+        to_position = move_object.move_to
 
         # Get the moving coordinates
         from_row, from_col = from_position
         to_row, to_col = to_position
 
+        # Clear the bits of the pieces currently at the origin and destination.
+        # The origin is read from the board (rather than the move object) so that
+        # reverting a promotion clears the queen's bits and not the pawn's.
+        origin_piece = self._chess_board[from_row][from_col]
+        destination_piece = self._chess_board[to_row][to_col]
+        if origin_piece is not None:
+            self._clear_square_bit(origin_piece, from_position)
+        if destination_piece is not None:
+            self._clear_square_bit(destination_piece, to_position)
+        self._set_square_bit(moving_piece, to_position)
+
         # Move the piece to the new position
         self._chess_board[from_row][from_col] = None
         self._chess_board[to_row][to_col] = moving_piece
@@ -204,7 +487,8 @@ class ChessBoard:
             return # Nothing to do as we've already 'replaced' the piece from the board
 
         elif move_type == 'en-passant': # Need to remove a piece
-            remove_row, remove_col = remove_position
+            remove_row, remove_col = move_object.remove_from
+            self._clear_square_bit(self._chess_board[remove_row][remove_col], (remove_row, remove_col))
             self._chess_board[remove_row][remove_col] = None
             # remove_piece.update_position(None)
 
@@ -223,6 +507,105 @@ class ChessBoard:
             # Recurse this method to move the rook
             self.update_board_positions(rook_move)
 
+    def revert_board_positions(self, move_object: ChessMove) -> None:
+        """
+        Put the board back the way it was before the passed move was applied.
+        The inverse of update_board_positions, applied in place so that reverting
+        does not have to allocate reversion move objects.
+        """
+
+        moving_piece = move_object.move_piece
+        from_position = move_object.move_from
+        to_position = move_object.move_to
+
+        # A promotion leaves a queen on the destination square, so clear the bits of
+        # whatever actually sits there rather than the pawn recorded on the move
+        destination_piece = self._chess_board[to_position[0]][to_position[1]]
+        self._clear_square_bit(destination_piece, to_position)
+        self._set_square_bit(moving_piece, from_position)
+        self._chess_board[to_position[0]][to_position[1]] = None
+        self._chess_board[from_position[0]][from_position[1]] = moving_piece
+        moving_piece.update_position(from_position)
+
+        # Move the rook back if castle move
+        if move_object.type.startswith('castle'):
+            rook_piece, rook_from_position, rook_to_position = self._get_castle_rook_move(move_object)
+            self._move_piece_minimal(rook_piece, rook_to_position, rook_from_position)
+            rook_piece.update_position(rook_from_position)
+
+        # If the move resulted in a capture, add the captured piece back
+        remove_piece = move_object.remove_piece
+        if remove_piece is not None:
+            remove_position = move_object.remove_from
+            self._set_square_bit(remove_piece, remove_position)
+            self._chess_board[remove_position[0]][remove_position[1]] = remove_piece
+            remove_piece.update_position(remove_position)
+
+    def _get_castle_rook_move(self, move_object) -> tuple:
+        """Return the rook piece, from position and to position for the passed castle move"""
+
+        move_type = move_object.type
+
+        orientation = -1 if move_type == 'castle-queen-side' else 1
+        from_position = move_object.move_from
+        to_position = move_object.move_to
+        rook_col = 0 if move_type == 'castle-queen-side' else 7
+        from_row = from_position[0]
+
+        rook_from_position = (from_row, rook_col)
+        rook_to_position = (from_row, to_position[1] - orientation)
+        rook_piece = self._chess_board[from_row][rook_col] or self._chess_board[rook_to_position[0]][rook_to_position[1]]
+
+        return rook_piece, rook_from_position, rook_to_position
+
+    def _move_piece_minimal(self, piece, from_position, to_position) -> None:
+        """Move a piece on the board list and bitboards only. Piece attributes are left alone."""
+
+        self._clear_square_bit(piece, from_position)
+        self._set_square_bit(piece, to_position)
+        self._chess_board[from_position[0]][from_position[1]] = None
+        self._chess_board[to_position[0]][to_position[1]] = piece
+
+    def make_test_move(self, move_object: ChessMove) -> None:
+        """
+        Apply a move with the minimum state changes needed for a check test.
+        Only the board list and the bitboards are touched; piece positions, sprite rects
+        and the game's move history are left alone. Reverse with unmake_test_move.
+
+        Promotions are applied as plain pawn moves since swapping in a queen
+        cannot change whether the moving player's own king is in check.
+        """
+
+        # Remove the captured piece first (it sits at the destination or, for en passant, beside it)
+        remove_piece = move_object.remove_piece
+        if remove_piece is not None:
+            remove_position = move_object.remove_from
+            self._clear_square_bit(remove_piece, remove_position)
+            self._chess_board[remove_position[0]][remove_position[1]] = None
+
+        self._move_piece_minimal(move_object.move_piece, move_object.move_from, move_object.move_to)
+
+        # Castling also moves the rook
+        if move_object.type.startswith('castle'):
+            rook_piece, rook_from_position, rook_to_position = self._get_castle_rook_move(move_object)
+            self._move_piece_minimal(rook_piece, rook_from_position, rook_to_position)
+
+    def unmake_test_move(self, move_object: ChessMove) -> None:
+        """Reverse the state changes made by make_test_move for the passed move"""
+
+        if move_object.type.startswith('castle'):
+            rook_piece, rook_from_position, rook_to_position = self._get_castle_rook_move(move_object)
+            self._move_piece_minimal(rook_piece, rook_to_position, rook_from_position)
+
+        self._move_piece_minimal(move_object.move_piece, move_object.move_to, move_object.move_from)
+
+        # Restore the captured piece
+        remove_piece = move_object.remove_piece
+        if remove_piece is not None:
+            remove_position = move_object.remove_from
+            self._set_square_bit(remove_piece, remove_position)
+            self._chess_board[remove_position[0]][remove_position[1]] = remove_piece
+
 
 class ChessPiece(pygame.sprite.Sprite):
     """
@@ -230,6 +613,13 @@ class ChessPiece(pygame.sprite.Sprite):
     There are 6 distinct pieces: Pawn, Knight, Rook, Bishop, Queen and King
     """
 
+    # Loaded piece images shared across instances, keyed by (class name, color)
+    _image_cache = {}
+
+    # Movement constants shared by all instances, overridden by each subclass
+    _allowed_move_orientations = ()  # Which directions the piece is allowed to move
+    _line_indices = ()  # Which LINE_RAY_PAIRS lines the piece slides along
+
     def __init__(self, color: str):
 
         super().__init__()
@@ -238,11 +628,31 @@ class ChessPiece(pygame.sprite.Sprite):
         self._visual = ''  # A placeholder for the letter which will represent a piece (for printing the board to the console)
         self._already_moved = False  # If the piece has already moved
         self._max_allowed_distance = 0  # How far a piece is allowed to go at most
-        self._allowed_move_orientations = [] # Which directions the piece is allowed to move
+        self._type_id = 0  # One of the module-level piece type ids, set by each subclass
         self._position = (None, None)  # Position on the board (row, col)
+        self._cached_moves = None  # The last generated move list and the key it was generated under
+        self._cached_moves_key = None
         self.image = None # The image which represents the piece
         self.rect = pygame.Rect((0, 0, square_size, square_size)) # The pygame rect object used to represent the piece
 
+    @classmethod
+    def _load_image(cls, color: str) -> pygame.Surface:
+        """
+        Return the scaled image for the piece class and color.
+        Each distinct image is read from disk and scaled only once, then shared.
+        """
+
+        key = (cls.__name__, color)
+        image = cls._image_cache.get(key)
+
+        if image is None:
+            image = pygame.transform.scale(
+                pygame.image.load('Assets/chess_sprites/' + color + '_' + cls.__name__.lower() + '.png'),
+                (square_size, square_size))
+            cls._image_cache[key] = image
+
+        return image
+
     def set_game(self, game):
         """Set the game variable. Should only be called once at the beginning of the game init."""
 
@@ -263,74 +673,131 @@ class ChessPiece(pygame.sprite.Sprite):
         game = self._game
         board = game.get_board_object()
 
-        # Make the move, check for check then revert the move
-        board.update_board_positions(move)
-        game.add_move(move)
+        # Make the move with the lightweight test helpers, check for check, then unmake it
+        board.make_test_move(move)
         check_player_is_in_check = game.check_player_is_in_check(self._color)
-        game.revert_last_move()
+        board.unmake_test_move(move)
 
         return check_player_is_in_check
 
-    def get_available_moves(self, check_for_checks=True) -> list:
+    def get_available_moves(self, check_for_checks=True, stop_on_first=False) -> list:
         """
         Get the available moves for a particular piece on the board.
-        This method will fetch the available moves for this piece based on its allowed movement rules.
 
         Returns a list of ChessMoves.
 
-        The default rules for a piece are that it can move in straight lines.
+        With stop_on_first the generation stops at the first move found, for callers
+        that only need to know whether any move exists (the mate test).
+
+        The full list is memoized, so asking again for an unchanged board (the
+        click-then-move sequence in the pygame loop, or the console flow's display
+        and validation passes) reuses the generated list.
+        """
+
+        game = self._game
+
+        # The key pins down everything a move list can depend on: the placement (hash),
+        # the turn the list was built on (last move object, which also covers en passant
+        # rights and the already-moved flags) and the legality filter
+        last_move = game.get_last_move_object() if game.get_current_move_number() > 1 else None
+        cache_key = (game.get_board_object().get_zobrist_hash(), last_move, check_for_checks)
+        if cache_key == self._cached_moves_key:
+            return self._cached_moves
+
+        # A possibly truncated stop_on_first list can serve this call but must not be cached.
+        # A complete cached list can serve a stop_on_first call, so that is still checked above
+        if stop_on_first:
+            return self._generate_available_moves(check_for_checks, True)
+
+        moves = self._generate_available_moves(check_for_checks, False)
+        self._cached_moves = moves
+        self._cached_moves_key = cache_key
+        return moves
+
+    def _generate_available_moves(self, check_for_checks, stop_on_first=False) -> list:
+        """
+        Generate the available moves for this piece based on its allowed movement rules.
+
+        The default rules for a piece are that it can move in straight lines. The reachable
+        squares per line are read from the precomputed occupancy-keyed attack tables.
         """
 
         moves = []
         board = self._game.get_board_object()
         from_row, from_col = self._position
+        square = from_row * 8 + from_col
 
-        for orientation in self._allowed_move_orientations:
+        # Hoist the occupancy bitboards once so the per-square tests below are O(1) bit tests
+        own_occupancy = board.get_occupancy(self._color)
+        opponent_occupancy = board.get_occupancy(self._game.get_opponent_color(self._color))
+        total_occupancy = own_occupancy | opponent_occupancy
 
-            vertical_direction, horizontal_direction = orientation
+        # OR the attacks for each of the piece's lines then mask out the player's own pieces
+        attack_bitboard = 0
+        for line_index in self._line_indices:
+            attack_bitboard |= get_line_attacks(square, line_index, total_occupancy)
 
-            # Get the first position that will be checked for legality
-            position_offset = (from_row + vertical_direction, from_col + horizontal_direction)
-            position_offset_on_board = board.position_is_on_board(position_offset)
-            dist = 1
+        attack_bitboard &= ~own_occupancy
+        self._add_moves_from_bitboard(attack_bitboard, board, moves, check_for_checks, stop_on_first)
 
-            # Loop until we reach the pieces max allowed distance or the position is not on the board anymore
-            while dist <= self._max_allowed_distance and position_offset_on_board:
+        return moves
 
-                cell_at_position = board.get_cell_at_position(position_offset)
+    def get_attack_bitboard(self) -> int:
+        """
+        Return the bitboard of squares this piece currently attacks.
 
-                cell_is_players_piece = cell_at_position is not None and cell_at_position.get_color() == self._color
-                if cell_is_players_piece:
-                    break  # Stop looping as we've hit a 'wall'
+        Unlike get_available_moves this skips the rules that can never capture
+        (castling, en passant, pawn pushes), which makes it the cheap primitive
+        for check detection.
+        """
 
-                cell_is_opponent_piece = cell_at_position is not None and cell_at_position.get_color() != self._color
-                if cell_is_opponent_piece:
-                    move = ChessMove(self._color, 'capture', self, cell_at_position, self._position, position_offset, position_offset)
-                    
-                    # Make sure the move doesn't result in check (if we are checking check)
-                    if check_for_checks:
-                        if not self.move_results_in_check(move):
-                            moves.append(move)
-                    else:
-                        moves.append(move)
-                        
-                    break  # Hit a wall again (that we can capture)
+        board = self._game.get_board_object()
+        row, col = self._position
+        square = row * 8 + col
+        total_occupancy = board.get_occupancy('white') | board.get_occupancy('black')
 
-                # If we've reached here, the cell is empty
-                move = ChessMove(self._color, 'move', self, None, self._position, position_offset, None)
-                if check_for_checks:
-                    if not self.move_results_in_check(move):
-                        moves.append(move)
-                else:
-                    moves.append(move)
+        attack_bitboard = 0
+        for line_index in self._line_indices:
+            attack_bitboard |= get_line_attacks(square, line_index, total_occupancy)
 
-                dist += 1
+        return attack_bitboard
 
-                # Advance the position offset by one cell in the direction we are checking
-                position_offset = (from_row + (vertical_direction * dist), from_col + (horizontal_direction * dist))
-                position_offset_on_board = board.position_is_on_board(position_offset)
+    def _add_moves_from_bitboard(self, attack_bitboard: int, board, moves: list, check_for_checks: bool,
+                                 stop_on_first: bool = False) -> None:
+        """
+        Append a move for each set bit in the passed attack bitboard.
+        Squares holding the player's own pieces must already be masked out of the bitboard.
+        With stop_on_first, return as soon as one move has been appended.
+        """
 
-        return moves
+        # Hoist the attribute reads out of the loop; every self.x inside is a dict probe
+        color = self._color
+        position = self._position
+        chess_board = board.get_board()
+        move_results_in_check = self.move_results_in_check
+
+        while attack_bitboard:
+            least_significant_bit = attack_bitboard & -attack_bitboard
+            square = least_significant_bit.bit_length() - 1
+            attack_bitboard ^= least_significant_bit
+
+            row, col = square // 8, square % 8
+            position_to_check = (row, col)
+            cell_at_position = chess_board[row][col]
+
+            if cell_at_position is not None:  # A capture
+                move = ChessMove(color, 'capture', self, cell_at_position, position, position_to_check, position_to_check)
+            else:  # A move
+                move = ChessMove(color, 'move', self, None, position, position_to_check, None)
+
+            if check_for_checks:
+                if not move_results_in_check(move):
+                    moves.append(move)
+            else:
+                moves.append(move)
+
+            if stop_on_first and moves:
+                return
 
     def get_already_moved(self) -> bool:
         """Return if the piece has already moved"""
@@ -383,16 +850,17 @@ class Pawn(ChessPiece):
         super().__init__(color)
         self._max_allowed_distance = 2
         self._visual = 'p'
-        self.image = pygame.transform.scale(pygame.image.load('Assets/chess_sprites/' + color + '_pawn.png'), (square_size, square_size))
+        self._type_id = PAWN
+        self.image = self._load_image(color)
 
         if color == 'white':
-            self._allowed_move_orientations = [[-1, 0]]
+            self._allowed_move_orientations = ((-1, 0),)
             self._end_row = 0
         else:
-            self._allowed_move_orientations = [[1, 0]]
+            self._allowed_move_orientations = ((1, 0),)
             self._end_row = 7
 
-    def get_available_moves(self, check_for_checks=True) -> list:
+    def _generate_available_moves(self, check_for_checks, stop_on_first=False) -> list:
         """
         Pawns move differently than the 'default' chess piece. They move forward and capture diagonally.
         They are also able to perform en passant moves.
@@ -401,53 +869,70 @@ class Pawn(ChessPiece):
         moves = []
         board = self._game.get_board_object()
 
+        # Hoist the occupancy bitboards once so the per-square tests below are O(1) bit tests
+        opponent_occupancy = board.get_occupancy(self._game.get_opponent_color(self._color))
+        total_occupancy = board.get_occupancy(self._color) | opponent_occupancy
+
         vert_direct = self._allowed_move_orientations[0][0]  # The vertical direction (1 or -1)
         from_row, from_col = self._position
+        end_row = self._end_row
 
-        ## Get regular moves
-        dist = 1
-        move_type = 'move'
-        while dist <= self._max_allowed_distance:
-            forward_row = from_row + (dist * vert_direct)
-            forward_position = (forward_row, from_col)
-            forward_cell = board.get_cell_at_position(forward_position)
+        ## Get regular moves as direct occupancy bit tests; pawns only ever have one or two push targets
+        forward_row = from_row + vert_direct
 
-            if forward_cell is not None:
-                break # Stop if there is a piece in front
-            else:
-                if self.get_end_row() == forward_row: # Check if move reaches opponent end
-                    move_type = 'queen'
-
-                move = ChessMove(self._color, move_type, self, None, self._position, forward_position, None) # There is a move
-                if check_for_checks:
-                    if not self.move_results_in_check(move):
-                        moves.append(move)
-                else:
+        if not total_occupancy & (1 << (forward_row * 8 + from_col)):
+            move_type = 'queen' if forward_row == end_row else 'move'
+            move = ChessMove(self._color, move_type, self, None, self._position, (forward_row, from_col), None)
+            if check_for_checks:
+                if not self.move_results_in_check(move):
                     moves.append(move)
-            dist += 1
-
-        # Get captures
-        move_type = 'capture'
-        for diag_direct in [1, -1]:  # Right then left
-
-            # Check if capture position has an opponent piece
-            forward_diagonal_position = (from_row + vert_direct, from_col + diag_direct)
-            if board.position_is_on_board(forward_diagonal_position):
-
-                cell_at_position = board.get_cell_at_position(forward_diagonal_position)
-                forward_cell_is_opponent = cell_at_position is not None and cell_at_position.get_color() != self._color
+            else:
+                moves.append(move)
 
-                if forward_cell_is_opponent:
-                    if self.get_end_row() == (from_row + vert_direct): # Check if move reaches opponent end
-                        move_type = 'queen'
+            if stop_on_first and moves:
+                return moves
 
-                    move = ChessMove(self._color, move_type, self, cell_at_position, self._position, forward_diagonal_position, forward_diagonal_position)
+            # The double push is only open while the single push square is empty too
+            double_row = forward_row + vert_direct
+            if self._max_allowed_distance == 2 and 0 <= double_row <= 7:
+                if not total_occupancy & (1 << (double_row * 8 + from_col)):
+                    move_type = 'queen' if double_row == end_row else 'move'
+                    move = ChessMove(self._color, move_type, self, None, self._position, (double_row, from_col), None)
                     if check_for_checks:
                         if not self.move_results_in_check(move):
                             moves.append(move)
                     else:
                         moves.append(move)
 
+                    if stop_on_first and moves:
+                        return moves
+
+        # Get captures by masking the precomputed diagonal attacks with the opponent's occupancy,
+        # which also takes care of the board edges. Attribute reads are hoisted out of the loop
+        color = self._color
+        position = self._position
+        chess_board = board.get_board()
+        capture_bitboard = PAWN_ATTACKS[color][from_row * 8 + from_col] & opponent_occupancy
+        while capture_bitboard:
+            least_significant_bit = capture_bitboard & -capture_bitboard
+            square = least_significant_bit.bit_length() - 1
+            capture_bitboard ^= least_significant_bit
+
+            row, col = square // 8, square % 8
+            capture_position = (row, col)
+            cell_at_position = chess_board[row][col]
+            move_type = 'queen' if row == end_row else 'capture'
+
+            move = ChessMove(color, move_type, self, cell_at_position, position, capture_position, capture_position)
+            if check_for_checks:
+                if not self.move_results_in_check(move):
+                    moves.append(move)
+            else:
+                moves.append(move)
+
+            if stop_on_first and moves:
+                return moves
+
         ## Get en passant moves
         move_type = 'en-passant'
         current_game_move_number = self._game.get_current_move_number()
@@ -462,7 +947,7 @@ class Pawn(ChessPiece):
         last_move_to = last_move_object.get_move_to()
 
         # If the piece that last moved isn't a pawn no en passant
-        if not isinstance(last_moving_piece, Pawn):
+        if last_moving_piece._type_id != PAWN:
             return moves
 
         last_to_row, last_to_col = last_move_to
@@ -491,6 +976,12 @@ class Pawn(ChessPiece):
         self._max_allowed_distance = 1
         self._already_moved = True
 
+    def get_attack_bitboard(self) -> int:
+        """Pawns only attack their two forward diagonals"""
+
+        row, col = self._position
+        return PAWN_ATTACKS[self._color][row * 8 + col]
+
     def get_end_row(self) -> int:
         """Get the 'end' row of the pawn. This is the row at the opposite side of the board"""
 
@@ -500,23 +991,29 @@ class Pawn(ChessPiece):
 class Bishop(ChessPiece):
     """Represents a bishop which can move diagonally"""
 
+    _allowed_move_orientations = ((1, 1), (1, -1), (-1, 1), (-1, -1))
+    _line_indices = (2, 3)
+
     def __init__(self, color: str):
         super().__init__(color)
+        self._type_id = BISHOP
         self._visual = 'b'
         self._max_allowed_distance = 8
-        self._allowed_move_orientations = [[1, 1], [1, -1], [-1, 1], [-1, -1]]
-        self.image = pygame.transform.scale(pygame.image.load('Assets/chess_sprites/' + color + '_bishop.png'), (square_size, square_size))
+        self.image = self._load_image(color)
 
 
 class Rook(ChessPiece):
     """Represents a rook which can move vertically and horizontally"""
 
+    _allowed_move_orientations = ((1, 0), (0, 1), (-1, 0), (0, -1))
+    _line_indices = (0, 1)
+
     def __init__(self, color: str):
         super().__init__(color)
+        self._type_id = ROOK
         self._visual = 'r'
         self._max_allowed_distance = 8
-        self._allowed_move_orientations = [[1, 0], [0, 1], [-1, 0], [0, -1]]
-        self.image = pygame.transform.scale(pygame.image.load('Assets/chess_sprites/' + color + '_rook.png'), (square_size, square_size))
+        self.image = self._load_image(color)
 
 
 class Knight(ChessPiece):
@@ -524,85 +1021,75 @@ class Knight(ChessPiece):
 
     def __init__(self, color: str):
         super().__init__(color)
+        self._type_id = KNIGHT
         self._visual = 'h'
-        self.image = pygame.image.load('Assets/chess_sprites/' + color + '_knight.png')
+        self.image = self._load_image(color)
 
-    def get_available_moves(self, check_for_checks=True) -> list:
-        """Knights move differently than the 'default' piece. They move in an L shape"""
+    def _generate_available_moves(self, check_for_checks, stop_on_first=False) -> list:
+        """
+        Knights move differently than the 'default' piece. They move in an L shape.
+        The reachable squares are read from the precomputed KNIGHT_ATTACKS table.
+        """
 
         moves = []
         board = self._game.get_board_object()
         from_row, from_col = self._position
 
-        def add_knight_move(position_to_check: tuple) -> None:
-            """Add valid moves based on what is present at the position_to_check"""
-
-            # Make sure the position is a valid one (since we are checking all L offsets)
-            position_on_board = board.position_is_on_board(position_to_check)
-
-            if position_on_board:
-
-                # Get the cell. If opponent, add a capture move, if empty add regular move.
-                cell_at_position = board.get_cell_at_position(position_to_check)
-                position_is_opponent = cell_at_position is not None and cell_at_position.get_color() != self._color
-                position_is_empty = cell_at_position is None
+        # Mask the player's own pieces out of the attack set then add a move per remaining square
+        attack_bitboard = KNIGHT_ATTACKS[from_row * 8 + from_col] & ~board.get_occupancy(self._color)
+        self._add_moves_from_bitboard(attack_bitboard, board, moves, check_for_checks, stop_on_first)
 
-                if position_is_opponent:  # A capture
-                    move = ChessMove(self._color, 'capture', self, cell_at_position, self._position, position_to_check, position_to_check)
-                    if check_for_checks:
-                        if not self.move_results_in_check(move):
-                            moves.append(move)
-                    else:
-                        moves.append(move)
-                elif position_is_empty:  # A move
-                    move = ChessMove(self._color, 'move', self, None, self._position, position_to_check, None)
-                    if check_for_checks:
-                        if not self.move_results_in_check(move):
-                            moves.append(move)
-                    else:
-                        moves.append(move)
+        return moves
 
-        # Loop through all possible sets of moves for knights
-        for i in [1, -1]:
-            for j in [2, -2]:
-                # First check for moves that move one cell vertically then two cells horizontally
-                add_knight_move((from_row + i, from_col + j))
+    def get_attack_bitboard(self) -> int:
+        """Knights attack the squares in their precomputed table"""
 
-                # Next check for moves that move two cells vertically then one cell horizontally
-                add_knight_move((from_row + j, from_col + i))
-
-        return moves
+        row, col = self._position
+        return KNIGHT_ATTACKS[row * 8 + col]
 
 
 class Queen(ChessPiece):
     """Represents a queen which can move vertically, horizontally or diagonally a maximum of eight spaces"""
 
+    _allowed_move_orientations = ((1, 1), (1, -1), (-1, 1), (-1, -1), (1, 0), (0, 1), (-1, 0), (0, -1))
+    _line_indices = (0, 1, 2, 3)
+
     def __init__(self, color: str):
         super().__init__(color)
+        self._type_id = QUEEN
         self._visual = 'q'
         self._max_allowed_distance = 8
-        self._allowed_move_orientations = [[1, 1], [1, -1], [-1, 1], [-1, -1], [1, 0], [0, 1], [-1, 0], [0, -1]]
-        self.image = pygame.transform.scale(pygame.image.load('Assets/chess_sprites/' + color + '_queen.png'), (square_size, square_size))
+        self.image = self._load_image(color)
 
 
 class King(ChessPiece):
     """Represents a king which can move vertically, horizontally or diagonally a maximum of one space"""
 
+    _allowed_move_orientations = ((1, 1), (1, -1), (-1, 1), (-1, -1), (1, 0), (0, 1), (-1, 0), (0, -1))
+
     def __init__(self, color: str):
         super().__init__(color)
+        self._type_id = KING
         self._visual = 'k'
         self._max_allowed_distance = 1
-        self._allowed_move_orientations = [[1, 1], [1, -1], [-1, 1], [-1, -1], [1, 0], [0, 1], [-1, 0], [0, -1]]
-        self.image = pygame.transform.scale(pygame.image.load('Assets/chess_sprites/' + color + '_king.png'), (square_size, square_size))
+        self.image = self._load_image(color)
 
-    def get_available_moves(self, check_for_checks=True) -> list:
-        """Kings have the same move set as the 'standard' piece but can also castle"""
+    def _generate_available_moves(self, check_for_checks, stop_on_first=False) -> list:
+        """
+        Kings have the same move set as the 'standard' piece but can also castle.
+        The one-step targets are read from the precomputed KING_ATTACKS table.
+        """
 
+        moves = []
         board = self._game.get_board_object()
         from_row, from_col = self._position
 
-        # Use the logic for the standard piece
-        moves = super().get_available_moves(check_for_checks)
+        # Mask the player's own pieces out of the attack set then add a move per remaining square
+        attack_bitboard = KING_ATTACKS[from_row * 8 + from_col] & ~board.get_occupancy(self._color)
+        self._add_moves_from_bitboard(attack_bitboard, board, moves, check_for_checks, stop_on_first)
+
+        if stop_on_first and moves:
+            return moves
 
         # Check if the king has already moved
         if not self._already_moved:
@@ -623,23 +1110,16 @@ class King(ChessPiece):
                 col_difference = rook_col - from_col
 
                 # Get orientation to determine queen side or king side castling
-                orientation = (col_difference > 0) - (col_difference < 0)
+                orientation = 1 if col_difference > 0 else -1
                 castle_type = 'queen-side' if orientation == -1 else 'king-side'
 
-                # Check if the path is clear between the king and rook
-                path_is_clear = True
-                offset = 1
-                while offset < abs(col_difference):
-                    offset_position = (from_row, from_col + (offset * orientation))
-                    cell = board.get_cell_at_position(offset_position)
-                    if cell is not None:
-                        path_is_clear = False
-                        break
-                    offset += 1
+                # Check if the path is clear between the king and rook with one mask test
+                total_occupancy = board.get_occupancy('white') | board.get_occupancy('black')
+                path_is_clear = not BETWEEN[from_row * 8 + from_col][rook_row * 8 + rook_col] & total_occupancy
 
                 # If the path is clear, the king hasn't moved and the rook hasn't moved, castling is legal
                 if path_is_clear:
-                    king_move_to_position = (from_row, from_col + ((offset - 1) * orientation))
+                    king_move_to_position = (from_row, from_col + ((abs(col_difference) - 1) * orientation))
                     move_type = 'castle-' + castle_type
                     move = ChessMove(self._color, move_type, self, None, self._position, king_move_to_position, None)
                     if check_for_checks:
@@ -650,6 +1130,12 @@ class King(ChessPiece):
 
         return moves
 
+    def get_attack_bitboard(self) -> int:
+        """Kings attack their eight neighbouring squares. Castling can never capture."""
+
+        row, col = self._position
+        return KING_ATTACKS[row * 8 + col]
+
 
 class ChessGame:
     """
@@ -663,14 +1149,14 @@ class ChessGame:
     def __init__(self):
 
         self._board = ChessBoard(self)
-        self._piece_sprites = pygame.sprite.Group()
+        self._piece_sprites = []  # A plain list: sprites only change on capture and promotion
         self._initialize_piece_data()        # Update the piece objects
-        self._colors = {'white', 'black'}
         self._active_player = 'white'       # White starts
         self._opponent_player = 'black'
         self._current_move_number = 1              # The current move we are on
         self._moves = []                    # Store the game moves
-        self._game_state = 'UNFINISHED'     
+        self._game_state = 'UNFINISHED'
+        self._check_cache = {}              # Memoized check results keyed by (position hash, color)
 
     def _initialize_piece_data(self):
         """Add the game reference and positions to the piece objects. Also add the piece to the sprite group."""
@@ -680,7 +1166,7 @@ class ChessGame:
                 if cell is not None: # A piece
                     cell.set_game(self)
                     cell.update_position((i, j))
-                    self._piece_sprites.add(cell)
+                    self._piece_sprites.append(cell)
     
     def add_move(self, move_object):
         """Add a move to the move list"""
@@ -690,7 +1176,7 @@ class ChessGame:
     def get_last_move_object(self):
         """Return the last move"""
 
-        return self._moves[len(self._moves)-1]
+        return self._moves[-1]
 
     def get_current_move_number(self):
         """Return the current move number"""
@@ -711,7 +1197,7 @@ class ChessGame:
         elif move_type == 'queen':
             self._piece_sprites.remove(move_piece)
             queen_piece = self._board.get_cell_at_position(move_to)
-            self._piece_sprites.add(queen_piece)
+            self._piece_sprites.append(queen_piece)
 
     def get_opponent_color(self, color):
         """
@@ -720,7 +1206,7 @@ class ChessGame:
         If the color argument is 'white', return 'black'
         """
 
-        return list(self._colors - {color})[0]  # Set difference operation
+        return OPPONENT_COLOR[color]
 
     def get_piece_sprites(self):
         """Return the list of piece sprites"""
@@ -757,10 +1243,7 @@ class ChessGame:
         The string must be a letter between a and h directly followed by a number between 1 and 8
         """
 
-        row_index = 8 - int(move[1])  # 8 minus because the board is reversed
-        col_index = self._board.get_column_map()[move[0].lower()]
-
-        return row_index, col_index,
+        return DECODED_COORDINATES[move.lower()]
 
     def make_move(self, move_from: str, move_to: str, numeric=False) -> bool:
         """
@@ -773,18 +1256,15 @@ class ChessGame:
         if self._game_state != 'UNFINISHED':
             return False
 
-        # Make sure the move is valid within the board
-        is_valid_from_move = True if re.match('^[a-hA-H][1-8]$', move_from) else False
-        is_valid_to_move = True if re.match('^[a-hA-H][1-8]$', move_from) else False
+        # Validate and decode each coordinate with a single table probe:
+        # a string is on the board exactly when the decode table knows it
+        from_position = DECODED_COORDINATES.get(move_from.lower())
+        to_position = DECODED_COORDINATES.get(move_to.lower())
 
-        if not is_valid_to_move or not is_valid_from_move:
+        if from_position is None or to_position is None:
             print('Invalid coordinates')
             return False
 
-        # Decode the move into int, int format
-        from_position = self.decode_player_input(move_from)
-        to_position = self.decode_player_input(move_to)
-
         # Get the cells at the coordinates
         from_cell = self._board.get_cell_at_position(from_position)
 
@@ -799,14 +1279,13 @@ class ChessGame:
         # Check if the move is in the set of available moves for the piece
         moves = from_cell.get_available_moves()
 
-        # Also get the move object associated with the player move
-        valid = False
-        for move in moves:
-            if to_position == move.get_move_to():
-                valid_move = move
-                valid = True
+        # Also get the move object associated with the player move.
+        # A piece never has two available moves to the same square, so a destination-keyed
+        # dict resolves the player's move in one lookup
+        moves_by_destination = {move.get_move_to(): move for move in moves}
+        valid_move = moves_by_destination.get(to_position)
 
-        if not valid:
+        if valid_move is None:
             print('Invalid move')
             return False
 
@@ -815,6 +1294,10 @@ class ChessGame:
         self.add_move(valid_move)
         self._current_move_number += 1
 
+        # Cached check results stay correct across moves (they only depend on piece placement)
+        # but the table is cleared each turn to keep it from growing over a long game
+        self._check_cache.clear()
+
         # Update sprites object
         self.update_piece_sprites(valid_move)
 
@@ -835,59 +1318,63 @@ class ChessGame:
     def revert_last_move(self) -> None:
         """Revert the board list and move list to their state right before the last move that occurred"""
 
-        move_object = self.get_last_move_object()
-        color, move_type, moving_piece, remove_piece, from_position, to_position, remove_position = move_object.get_move()
+        self._board.revert_board_positions(self._moves.pop())
 
-        # Invert the move and send it to update_board_positions
-        reversion_move = ChessMove(color, 'move', moving_piece, None, to_position, from_position, None)
-        self._board.update_board_positions(reversion_move)
+    def square_is_attacked(self, position: tuple, by_color: str) -> bool:
+        """
+        Return if the passed square is attacked by any of the passed color's pieces.
 
-        # Move rook back if castle move
-        if move_type.startswith('castle'):
+        Works backwards from the square itself: a piece attacks the square exactly when
+        the square 'attacks' the piece's square with that piece's own movement pattern,
+        so each piece type costs one table lookup instead of a loop over the pieces.
+        """
 
-            rook_col = 2 if move_type == 'castle-queen-side' else 5
-            rook_old_col = 0 if move_type == 'castle-queen-side' else 7
-            move_row, _ = from_position
-            rook_position = (move_row, rook_col)
-            rook_piece = self._board.get_cell_at_position(rook_position)
-            rook_old_position = (move_row, rook_old_col)
-            reversion_rook_move = ChessMove(color, 'move', rook_piece, None, rook_position, rook_old_position, None)
-            self._board.update_board_positions(reversion_rook_move)
+        board = self._board
+        square = position[0] * 8 + position[1]
 
-        # If the move resulted in a capture, add the piece back
-        if remove_piece:
-            self._board.add_piece_at_position(remove_piece, remove_position)
+        if KNIGHT_ATTACKS[square] & board.get_piece_bitboard(by_color, 'Knight'):
+            return True
 
-        self._moves.pop()
+        if KING_ATTACKS[square] & board.get_piece_bitboard(by_color, 'King'):
+            return True
 
-    def check_player_is_in_check(self, color: str) -> bool:
-        """Return if the kings position is in the set of available moves of the opponent's pieces"""
+        # An attacking pawn sits where a defending pawn on this square could capture
+        if PAWN_ATTACKS[OPPONENT_COLOR[by_color]][square] & board.get_piece_bitboard(by_color, 'Pawn'):
+            return True
 
-        # Get the 'color' player
-        try:
-            players_king_position, = self._board.get_piece_positions(color, 'King')  # Only one value will be returned so unpack
-        except:
-            raise('Error: No king or multiple kings for one color on board')
+        total_occupancy = board.get_occupancy('white') | board.get_occupancy('black')
+        queens = board.get_piece_bitboard(by_color, 'Queen')
 
-        # Create a set we will fill with the opponents moves
-        opponent_color = self.get_opponent_color(color)
-        opponent_piece_positions = self._board.get_piece_positions(opponent_color)
+        diagonal_sliders = board.get_piece_bitboard(by_color, 'Bishop') | queens
+        if diagonal_sliders:
+            diagonal_attacks = get_line_attacks(square, 2, total_occupancy) | get_line_attacks(square, 3, total_occupancy)
+            if diagonal_attacks & diagonal_sliders:
+                return True
 
-        # Get the distinct set of moves that the opponent pieces can make
-        for opponent_position in opponent_piece_positions:
+        straight_sliders = board.get_piece_bitboard(by_color, 'Rook') | queens
+        if straight_sliders:
+            straight_attacks = get_line_attacks(square, 0, total_occupancy) | get_line_attacks(square, 1, total_occupancy)
+            if straight_attacks & straight_sliders:
+                return True
 
-            piece = self._board.get_cell_at_position(opponent_position)
-            moves = piece.get_available_moves(check_for_checks=False)
+        return False
 
-            for move in moves:
-                to_position = move.get_move_to()
+    def check_player_is_in_check(self, color: str) -> bool:
+        """Return if the kings position is attacked by any of the opponent's pieces"""
 
-                # If the players king position is in the set of available moves for any opponent piece, the king is in check
-                if players_king_position == to_position:
-                    return True
+        # Identical piece placements give identical answers, so reuse a memoized result if there is one
+        cache_key = (self._board.get_zobrist_hash(), color)
+        cached_result = self._check_cache.get(cache_key)
+        if cached_result is not None:
+            return cached_result
 
-        # If we've reached here, the opponent does not have a move at the active player's king position
-        return False
+        king_square = self._board.get_piece_bitboard(color, 'King').bit_length() - 1
+        king_position = (king_square // 8, king_square % 8)
+
+        in_check = self.square_is_attacked(king_position, self.get_opponent_color(color))
+
+        self._check_cache[cache_key] = in_check
+        return in_check
 
     def check_player_is_mated(self) -> bool:
         """
@@ -904,15 +1391,57 @@ class ChessGame:
         if not king_in_check:
             return False
 
-        # Get the opponent's piece positions then loop through them
-        opponent_piece_positions = list(self._board.get_piece_positions(self._opponent_player)) # Copy
+        # Try the king's own moves first: an escape square is by far the most common way
+        # out of check, and finding one ends the mate test with no other piece examined
+        king_position = self._board.get_piece_positions(self._opponent_player, 'King')[0]
+        king = self._board.get_cell_at_position(king_position)
+        if king.get_available_moves(check_for_checks=True, stop_on_first=True):
+            return False
+
+        # Work backwards from the king to find the checking pieces
+        king_square = king_position[0] * 8 + king_position[1]
+        king_bitboard = 1 << king_square
+
+        checkers = 0
+        active_occupancy = self._board.get_occupancy(self._active_player)
+        while active_occupancy:
+            least_significant_bit = active_occupancy & -active_occupancy
+            square = least_significant_bit.bit_length() - 1
+            active_occupancy ^= least_significant_bit
+
+            piece = self._board.get_cell_at_position((square // 8, square % 8))
+            if piece.get_attack_bitboard() & king_bitboard:
+                checkers |= least_significant_bit
+
+        # A double check can only be answered by a king move, and those are exhausted
+        if checkers & (checkers - 1):
+            return True
+
+        # A single check can only be answered by capturing the checker or blocking its ray,
+        # so only pieces that can reach one of those squares need their moves generated
+        checker_square = checkers.bit_length() - 1
+        resolution_mask = BETWEEN[king_square][checker_square] | checkers
+
+        # Snapshot the opponent's occupancy as a single int (minus the king, already tried).
+        # The board mutates while candidate moves are tested, but the snapshot is unaffected
+        candidate_bitboard = self._board.get_occupancy(self._opponent_player) & ~king_bitboard
+
+        while candidate_bitboard:
+            least_significant_bit = candidate_bitboard & -candidate_bitboard
+            square = least_significant_bit.bit_length() - 1
+            candidate_bitboard ^= least_significant_bit
 
-        for opponent_position in opponent_piece_positions:
+            piece = self._board.get_cell_at_position((square // 8, square % 8))
 
-            piece = self._board.get_cell_at_position(opponent_position)
+            # Pawns are never prefiltered: their pushes and en passant captures
+            # resolve check on squares outside their attack set
+            if piece._type_id != PAWN and not piece.get_attack_bitboard() & resolution_mask:
+                continue
 
-            # Get the available moves for the piece taking into account if the king remains in check
-            moves = piece.get_available_moves(check_for_checks=True)
+            # Get the available moves for the piece taking into account if the king remains in check.
+            # The player is in check, so any legal move found here resolves it and
+            # generation can stop at the first one
+            moves = piece.get_available_moves(check_for_checks=True, stop_on_first=True)
 
             # If there are any moves which result in the king not being in check then no mate
             if moves:
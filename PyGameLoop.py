@@ -22,16 +22,15 @@ letter_list = ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H']
 # Define the board background colors
 square_color_1 = pygame.Color(160, 84, 28)
 square_color_2 = pygame.Color(216, 188, 152)
-board_background = [[None]*8]*8
+square_colors = [[square_color_1 if (top - left) % 2 == 0 else square_color_2 for left in range(8)]
+                 for top in range(8)]
 
 # White window
 window_color = pygame.Color((255, 255, 255))
 window.fill(window_color)
 
-
-def get_square_color(top, left):
-
-    return square_color_1 if (top - left) % 2 == 0 else square_color_2
+# Screen regions touched since the last display update
+dirty_rects = []
 
 
 def get_offset_position(index):
@@ -39,32 +38,43 @@ def get_offset_position(index):
     return index * square_size + outer_margin
 
 
-def draw_background():
+def build_board_surface():
+
+    # Render the static board squares and headers once so redraws are a single blit
+    surface = pygame.Surface((width, height))
+    surface.fill(window_color)
+
+    for index in range(8):
+        header = header_font.render(letter_list[index], True, (0, 0, 0))
+        surface.blit(header, (index * square_size + outer_margin + (square_size / 2), outer_margin / 2))
+        header = header_font.render(number_list[index], True, (0, 0, 0))
+        surface.blit(header, (outer_margin / 2, index * square_size + outer_margin + (square_size / 2)))
 
-    # Draw the board and load the background list
     for top in range(8): # top = row
         for left in range(8): # left = col
 
-            if top == 0:  # Column headers
-                header = header_font.render(letter_list[left], True, (0, 0, 0))
-                window.blit(header, (left * square_size + outer_margin + (square_size / 2), outer_margin / 2))
-            if left == 0:  # Row headers
-                header = header_font.render(number_list[top], True, (0, 0, 0))
-                window.blit(header, (outer_margin / 2, top * square_size + outer_margin + (square_size / 2)))
-
             top_offset = get_offset_position(top)
             left_offset = get_offset_position(left)
 
-            square_color_choice = get_square_color(top, left)
-            board_background[top][left] = square_color_choice
-
             rect = pygame.Rect((left_offset, top_offset, square_size, square_size))
-            pygame.draw.rect(window, square_color_choice, rect)
+            pygame.draw.rect(surface, square_colors[top][left], rect)
+
+    return surface
+
+
+board_surface = build_board_surface()
+
+
+def draw_background():
+
+    window.blit(board_surface, (0, 0))
+    dirty_rects.append(window.get_rect())
 
 
 def draw_sprites():
-    all_chess_piece_sprites = game.get_piece_sprites()
-    all_chess_piece_sprites.draw(window)
+    for sprite in game.get_piece_sprites():
+        window.blit(sprite.image, sprite.rect)
+        dirty_rects.append(sprite.rect)
 
 
 def draw_player_turn():
@@ -73,6 +83,7 @@ def draw_player_turn():
     turn_rect = pygame.Rect((board_size/2, board_size-(outer_margin/2)) + turn_surface.get_size())
     window.fill(window_color, turn_rect)
     window.blit(turn_surface, turn_rect)
+    dirty_rects.append(turn_rect)
 
 
 draw_background()
@@ -82,9 +93,13 @@ draw_player_turn()
 circle_color = (119, 136, 153)
 
 moves = []
+moves_by_square = {}
 piece_clicked = False
 game_active = True
 
+# Cap the loop rate
+clock = pygame.time.Clock()
+
 # Main game loop
 running = True
 while running:
@@ -94,66 +109,71 @@ while running:
 
         # Player left clicks
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            # The board is a regular grid so the clicked square is plain arithmetic
+            clicked_left = (event.pos[0] - outer_margin) // square_size
+            clicked_top = (event.pos[1] - outer_margin) // square_size
+            click_is_on_board = 0 <= clicked_top <= 7 and 0 <= clicked_left <= 7
 
             if not piece_clicked:
-                active_player = game.get_active_player()
-                for sprite in game.get_piece_sprites():
-                    if sprite.rect.collidepoint(event.pos) and sprite.get_color() == active_player: # The players piece is clicked
+                if click_is_on_board:
+                    sprite = chess_board.get_cell_at_position((clicked_top, clicked_left))
+                    if sprite is not None and sprite.get_color() == game.get_active_player(): # The players piece is clicked
                         piece_clicked = True
                         moves = sprite.get_available_moves()
+                        moves_by_square = {move.get_move_to(): move for move in moves}
                         for move in moves:
                             move_to = move.get_move_to()
                             raw_move_top, raw_move_left = move_to
                             move_left, move_top = get_offset_position(raw_move_left), get_offset_position(raw_move_top)
 
-                            available_move_color = get_square_color(raw_move_top, raw_move_left)
-
                             # Draw small circles where there are available moves
                             circle_center = move_left+(square_size/2), move_top+(square_size/2)
                             pygame.draw.circle(window, circle_color, circle_center, square_size/18)
-
-                        break
+                            dirty_rects.append(pygame.Rect((move_left, move_top, square_size, square_size)))
 
             # Check for move to position if a piece is clicked
             else:
+                # First erase every highlight circle, then redraw the pieces once
                 for move in moves:
-
                     move_to = move.get_move_to()
-                    # Get the move rect on the pygame board
                     move_left, move_top = get_offset_position(move_to[1]), get_offset_position(move_to[0])
                     move_rect = pygame.Rect((move_left, move_top, square_size, square_size))
 
-                    # Redraw the background where the available move circle is
-                    background_square_color = get_square_color(*move_to)
+                    background_square_color = square_colors[move_to[0]][move_to[1]]
                     pygame.draw.rect(window, background_square_color, move_rect)
+                    dirty_rects.append(move_rect)
 
-                    draw_sprites()
-
-                    if move_rect.collidepoint(event.pos):
+                draw_sprites()
 
-                        # Convert the move into the string the game's make_move method takes
-                        y, x = move_to
-                        move_from_str = letter_list[sprite.get_position()[1]] + str(8-sprite.get_position()[0])
-                        move_to_str = letter_list[x] + str(8-y)
+                # Then check if the clicked square is one of the available moves
+                move = moves_by_square.get((clicked_top, clicked_left)) if click_is_on_board else None
+                if move is not None:
 
-                        # Make the move
-                        game.make_move(move_from_str, move_to_str)
+                    # Convert the move into the string the game's make_move method takes
+                    y, x = move.get_move_to()
+                    move_from_str = letter_list[sprite.get_position()[1]] + str(8-sprite.get_position()[0])
+                    move_to_str = letter_list[x] + str(8-y)
 
-                        # Draw background, overlay the pieces then redraw the player turn
-                        draw_background()
-                        draw_sprites()
-                        draw_player_turn()
+                    # Make the move
+                    game.make_move(move_from_str, move_to_str)
 
-                        if game.get_game_state() != 'UNFINISHED':
-                            game_active = False
+                    # Draw background, overlay the pieces then redraw the player turn
+                    draw_background()
+                    draw_sprites()
+                    draw_player_turn()
 
-                        break
+                    if game.get_game_state() != 'UNFINISHED':
+                        game_active = False
 
                 # Unclick the piece so the player can click on other pieces and get their available moves
                 piece_clicked = False
 
-    # Draw/Render the screen
-    pygame.display.flip()
+    # Push only the regions that were drawn this frame to the screen
+    if dirty_rects:
+        pygame.display.update(dirty_rects)
+        dirty_rects.clear()
+
+    clock.tick(60)
 
     # When the game is over, add 'GAME OVER' to the screen for 3 seconds the close window
     if not game_active: